@@ -175,7 +175,7 @@ def guild_id(self) -> snowflakes.Snowflake:
         """ID of the guild that this event occurred in."""
         guild_id = self.message.guild_id
         # Always present on guild events
-        assert isinstance(guild_id, snowflakes.Snowflake), "no guild_id attribute set"
+        assert guild_id is not None, "no guild_id attribute set"
         return guild_id
 
     def get_channel(self) -> typing.Optional[channels.TextableGuildChannel]:
@@ -413,7 +413,7 @@ def guild_id(self) -> snowflakes.Snowflake:
         """ID of the guild that this event occurred in."""
         guild_id = self.message.guild_id
         # Always present on guild events
-        assert isinstance(guild_id, snowflakes.Snowflake), f"expected guild_id, got {guild_id}"
+        assert guild_id is not None, "no guild_id attribute set"
         return guild_id
 
     def get_channel(self) -> typing.Optional[channels.TextableGuildChannel]:
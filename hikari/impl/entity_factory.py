@@ -84,16 +84,41 @@
     commands.OptionType.ATTACHMENT: snowflakes.Snowflake,
 }
 
+# Resolved directly rather than through the enum's metaclass call, as this is done for every audit log entry.
+_audit_log_event_type_mapping: dict[int, audit_log_models.AuditLogEventType] = {
+    event_type.value: event_type for event_type in audit_log_models.AuditLogEventType
+}
+
 
 def _with_int_cast(cast: typing.Callable[[int], ValueT]) -> typing.Callable[[typing.Any], ValueT]:
     """Wrap a cast to ensure the value passed to it will first be cast to int."""
     return lambda value: cast(int(value))
 
 
+def _audit_log_change_builder(
+    key: audit_log_models.AuditLogChangeKey, cast: typing.Optional[typing.Callable[[typing.Any], typing.Any]]
+) -> typing.Callable[[typing.Any, typing.Any], audit_log_models.AuditLogChange]:
+    """Create a constructor for audit log changes of a known key, specialised for its value cast."""
+    if cast is None:
+        return lambda new_value, old_value: audit_log_models.AuditLogChange(
+            key=key, new_value=new_value, old_value=old_value
+        )
+
+    return lambda new_value, old_value: audit_log_models.AuditLogChange(
+        key=key,
+        new_value=cast(new_value) if new_value is not None else None,
+        old_value=cast(old_value) if old_value is not None else None,
+    )
+
+
 def _deserialize_seconds_timedelta(seconds: typing.Union[str, int]) -> datetime.timedelta:
     return datetime.timedelta(seconds=int(seconds))
 
 
+def _deserialize_minutes_timedelta(minutes: typing.Union[str, int]) -> datetime.timedelta:
+    return datetime.timedelta(minutes=int(minutes))
+
+
 def _deserialize_day_timedelta(days: typing.Union[str, int]) -> datetime.timedelta:
     return datetime.timedelta(days=int(days))
 
@@ -430,7 +455,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
 
     __slots__: typing.Sequence[str] = (
         "_app",
-        "_audit_log_entry_converters",
+        "_audit_log_change_builders",
         "_audit_log_event_mapping",
         "_command_mapping",
         "_message_component_type_mapping",
@@ -445,7 +470,9 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
 
     def __init__(self, app: traits.RESTAware) -> None:
         self._app = app
-        self._audit_log_entry_converters: dict[str, typing.Callable[[typing.Any], typing.Any]] = {
+        audit_log_entry_converters: dict[
+            audit_log_models.AuditLogChangeKey, typing.Callable[[typing.Any], typing.Any]
+        ] = {
             audit_log_models.AuditLogChangeKey.OWNER_ID: snowflakes.Snowflake,
             audit_log_models.AuditLogChangeKey.AFK_CHANNEL_ID: snowflakes.Snowflake,
             audit_log_models.AuditLogChangeKey.AFK_TIMEOUT: _deserialize_seconds_timedelta,
@@ -459,8 +486,8 @@ def __init__(self, app: traits.RESTAware) -> None:
             audit_log_models.AuditLogChangeKey.WIDGET_CHANNEL_ID: snowflakes.Snowflake,
             audit_log_models.AuditLogChangeKey.POSITION: int,
             audit_log_models.AuditLogChangeKey.BITRATE: int,
-            audit_log_models.AuditLogChangeKey.DEFAULT_AUTO_ARCHIVE_DURATION: lambda v: datetime.timedelta(minutes=v),
-            audit_log_models.AuditLogChangeKey.AUTO_ARCHIVE_DURATION: lambda v: datetime.timedelta(minutes=v),
+            audit_log_models.AuditLogChangeKey.DEFAULT_AUTO_ARCHIVE_DURATION: _deserialize_minutes_timedelta,
+            audit_log_models.AuditLogChangeKey.AUTO_ARCHIVE_DURATION: _deserialize_minutes_timedelta,
             audit_log_models.AuditLogChangeKey.APPLICATION_ID: snowflakes.Snowflake,
             audit_log_models.AuditLogChangeKey.PERMISSIONS: _with_int_cast(permission_models.Permissions),
             audit_log_models.AuditLogChangeKey.COLOR: color_models.Color,
@@ -486,6 +513,13 @@ def __init__(self, app: traits.RESTAware) -> None:
             audit_log_models.AuditLogChangeKey.PERMISSION_OVERWRITES: self._deserialize_audit_log_overwrites,
             audit_log_models.AuditLogChangeKey.COMMUNICATION_DISABLED_UNTIL: time.iso8601_datetime_string_to_datetime,
         }
+        # Keyed by the raw string value so the payload's key can be looked up directly
+        self._audit_log_change_builders: dict[
+            str, typing.Callable[[typing.Any, typing.Any], audit_log_models.AuditLogChange]
+        ] = {
+            key.value: _audit_log_change_builder(key, audit_log_entry_converters.get(key))
+            for key in audit_log_models.AuditLogChangeKey
+        }
         self._audit_log_event_mapping: dict[
             typing.Union[int, audit_log_models.AuditLogEventType],
             typing.Callable[[data_binding.JSONObject], audit_log_models.BaseAuditLogEntryInfo],
@@ -766,10 +800,13 @@ def _deserialize_audit_log_change_roles(
     def _deserialize_audit_log_overwrites(
         self, payload: data_binding.JSONArray
     ) -> typing.Mapping[snowflakes.Snowflake, channel_models.PermissionOverwrite]:
-        return {
-            snowflakes.Snowflake(overwrite["id"]): self.deserialize_permission_overwrite(overwrite)
-            for overwrite in payload
-        }
+        overwrites: dict[snowflakes.Snowflake, channel_models.PermissionOverwrite] = {}
+        deserialize_overwrite = self.deserialize_permission_overwrite
+        for overwrite_payload in payload:
+            overwrite = deserialize_overwrite(overwrite_payload)
+            overwrites[overwrite.id] = overwrite
+
+        return overwrites
 
     def _deserialize_channel_overwrite_entry_info(
         self, payload: data_binding.JSONObject
@@ -836,21 +873,22 @@ def deserialize_audit_log_entry(
 
         changes: list[audit_log_models.AuditLogChange] = []
         if (change_payloads := payload.get("changes")) is not None:
+            # Bound outside of the loop to avoid repeated attribute lookups for every change
+            get_builder = self._audit_log_change_builders.get
             for change_payload in change_payloads:
-                key: typing.Union[audit_log_models.AuditLogChangeKey, str] = audit_log_models.AuditLogChangeKey(
-                    change_payload["key"]
-                )
-
-                new_value = change_payload.get("new_value")
-                old_value = change_payload.get("old_value")
-                if value_converter := self._audit_log_entry_converters.get(key):
-                    new_value = value_converter(new_value) if new_value is not None else None
-                    old_value = value_converter(old_value) if old_value is not None else None
-
-                elif not isinstance(key, audit_log_models.AuditLogChangeKey):  # pyright: ignore [reportUnnecessaryIsInstance]
-                    _LOGGER.debug("Unknown audit log change key found %r", key)
+                raw_key = change_payload["key"]
+                if (build_change := get_builder(raw_key)) is not None:
+                    changes.append(build_change(change_payload.get("new_value"), change_payload.get("old_value")))
+                    continue
 
-                changes.append(audit_log_models.AuditLogChange(key=key, new_value=new_value, old_value=old_value))
+                _LOGGER.debug("Unknown audit log change key found %r", raw_key)
+                changes.append(
+                    audit_log_models.AuditLogChange(
+                        key=raw_key,
+                        new_value=change_payload.get("new_value"),
+                        old_value=change_payload.get("old_value"),
+                    )
+                )
 
         target_id: typing.Optional[snowflakes.Snowflake] = None
         if (raw_target_id := payload["target_id"]) is not None:
@@ -860,8 +898,9 @@ def deserialize_audit_log_entry(
         if (raw_user_id := payload["user_id"]) is not None:
             user_id = snowflakes.Snowflake(raw_user_id)
 
+        raw_action_type: int = payload["action_type"]
         action_type: typing.Union[audit_log_models.AuditLogEventType, int]
-        action_type = audit_log_models.AuditLogEventType(payload["action_type"])
+        action_type = _audit_log_event_type_mapping.get(raw_action_type, raw_action_type)
 
         options: typing.Optional[audit_log_models.BaseAuditLogEntryInfo] = None
         if (raw_option := payload.get("options")) is not None:
@@ -886,10 +925,11 @@ def deserialize_audit_log_entry(
     def deserialize_audit_log(
         self, payload: data_binding.JSONObject, *, guild_id: snowflakes.Snowflake
     ) -> audit_log_models.AuditLog:
-        entries = {}
+        entries: dict[snowflakes.Snowflake, audit_log_models.AuditLogEntry] = {}
+        deserialize_entry = self.deserialize_audit_log_entry
         for entry_payload in payload["audit_log_entries"]:
             try:
-                entry = self.deserialize_audit_log_entry(entry_payload, guild_id=guild_id)
+                entry = deserialize_entry(entry_payload, guild_id=guild_id)
 
             except errors.UnrecognisedEntityError as exc:
                 _LOGGER.debug(exc.reason)
@@ -897,16 +937,25 @@ def deserialize_audit_log(
             else:
                 entries[entry.id] = entry
 
-        integrations = {
-            snowflakes.Snowflake(integration["id"]): self.deserialize_partial_integration(integration)
-            for integration in payload["integrations"]
-        }
-        users = {snowflakes.Snowflake(user["id"]): self.deserialize_user(user) for user in payload["users"]}
+        # The deserialized entities already carry their parsed IDs, so key on those
+        # rather than parsing each raw ID a second time.
+        integrations: dict[snowflakes.Snowflake, guild_models.PartialIntegration] = {}
+        deserialize_integration = self.deserialize_partial_integration
+        for integration_payload in payload["integrations"]:
+            integration = deserialize_integration(integration_payload)
+            integrations[integration.id] = integration
+
+        users: dict[snowflakes.Snowflake, user_models.User] = {}
+        deserialize_user = self.deserialize_user
+        for user_payload in payload["users"]:
+            user = deserialize_user(user_payload)
+            users[user.id] = user
 
         threads: dict[snowflakes.Snowflake, channel_models.GuildThreadChannel] = {}
+        deserialize_thread = self.deserialize_guild_thread
         for thread_payload in payload["threads"]:
             try:
-                thread = self.deserialize_guild_thread(thread_payload)
+                thread = deserialize_thread(thread_payload)
 
             except errors.UnrecognisedEntityError:
                 continue
@@ -914,9 +963,10 @@ def deserialize_audit_log(
             threads[thread.id] = thread
 
         webhooks: dict[snowflakes.Snowflake, webhook_models.PartialWebhook] = {}
+        deserialize_webhook = self.deserialize_webhook
         for webhook_payload in payload["webhooks"]:
             try:
-                webhook = self.deserialize_webhook(webhook_payload)
+                webhook = deserialize_webhook(webhook_payload)
 
             except errors.UnrecognisedEntityError:
                 continue
@@ -694,7 +694,9 @@ def deserialize_guild_message_delete_bulk_event(
             shard=shard,
             channel_id=snowflakes.Snowflake(payload["channel_id"]),
             guild_id=snowflakes.Snowflake(payload["guild_id"]),
-            message_ids=collections.SnowflakeSet(*(snowflakes.Snowflake(message_id) for message_id in payload["ids"])),
+            # SnowflakeSet stores raw 64-bit ints, so wrapping each ID in a Snowflake would be wasted work. Sorting
+            # them first also means every insertion is an append rather than a shift of the underlying array.
+            message_ids=collections.SnowflakeSet(*sorted(int(message_id) for message_id in payload["ids"])),
             old_messages=old_messages or {},
         )
 
@@ -810,8 +810,9 @@ async def __anext__(self) -> audit_logs.AuditLog:
         log = self._entity_factory.deserialize_audit_log(response, guild_id=self._guild_id)
         # Since deserialize_audit_log may skip entries it doesn't recognise,
         # first_id has to be calculated based on the raw payload as log.entries
-        # may be missing entries.
-        self._first_id = str(min(entry["id"] for entry in audit_log_entries))
+        # may be missing entries. IDs are compared numerically, as comparing
+        # the raw strings breaks when they differ in length.
+        self._first_id = min(audit_log_entries, key=lambda entry: int(entry["id"]))["id"]
         return log
 
 
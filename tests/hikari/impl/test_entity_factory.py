@@ -1512,6 +1512,22 @@ def test_deserialize_audit_log_entry_with_unhandled_change_key(self, entity_fact
         assert change.new_value == [{"id": "568651298858074123", "name": "Casual"}]
         assert change.old_value == [{"id": "123123123312312", "name": "aRole"}]
 
+    def test_deserialize_audit_log_entry_with_converted_change_key_and_missing_value(
+        self, entity_factory_impl, audit_log_entry_payload
+    ):
+        audit_log_entry_payload["changes"][0] = {"key": "owner_id", "new_value": "123321"}
+
+        entry = entity_factory_impl.deserialize_audit_log_entry(
+            audit_log_entry_payload, guild_id=snowflakes.Snowflake(4123123)
+        )
+
+        assert len(entry.changes) == 1
+        change = entry.changes[0]
+        assert change.key == audit_log_models.AuditLogChangeKey.OWNER_ID
+        assert change.new_value == 123321
+        assert isinstance(change.new_value, snowflakes.Snowflake)
+        assert change.old_value is None
+
     def test_deserialize_audit_log_entry_with_change_key_unknown(self, entity_factory_impl, audit_log_entry_payload):
         # Unset fields
         audit_log_entry_payload["changes"][0]["key"] = "unknown"
@@ -436,6 +436,44 @@ async def test_aiter_when_empty_chunk(self, newest_first: bool):
         mock_request.assert_awaited_once_with(compiled_route=expected_route, query=query)
 
 
+class TestAuditLogIterator:
+    @pytest.mark.asyncio
+    async def test_aiter(self):
+        expected_route = routes.GET_GUILD_AUDIT_LOGS.compile(guild=10000)
+        mock_entity_factory = mock.Mock()
+        mock_log_1 = mock.Mock()
+        mock_log_2 = mock.Mock()
+        mock_entity_factory.deserialize_audit_log.side_effect = [mock_log_1, mock_log_2]
+        mock_response_1 = {"audit_log_entries": [{"id": "1000"}, {"id": "999"}, {"id": "1001"}]}
+        mock_response_2 = {"audit_log_entries": [{"id": "88"}, {"id": "100"}]}
+        mock_request = mock.AsyncMock(side_effect=[mock_response_1, mock_response_2, {"audit_log_entries": []}])
+        iterator = special_endpoints.AuditLogIterator(
+            entity_factory=mock_entity_factory,
+            request_call=mock_request,
+            guild=10000,
+            before=undefined.UNDEFINED,
+            user=undefined.UNDEFINED,
+            action_type=undefined.UNDEFINED,
+        )
+
+        result = await iterator
+
+        assert result == [mock_log_1, mock_log_2]
+        mock_entity_factory.deserialize_audit_log.assert_has_calls(
+            [
+                mock.call(mock_response_1, guild_id=snowflakes.Snowflake(10000)),
+                mock.call(mock_response_2, guild_id=snowflakes.Snowflake(10000)),
+            ]
+        )
+        mock_request.assert_has_awaits(
+            [
+                mock.call(compiled_route=expected_route, query={"limit": "100"}),
+                mock.call(compiled_route=expected_route, query={"limit": "100", "before": "999"}),
+                mock.call(compiled_route=expected_route, query={"limit": "100", "before": "88"}),
+            ]
+        )
+
+
 @pytest.mark.asyncio
 class TestGuildThreadIterator:
     @pytest.mark.parametrize("before_is_timestamp", [True, False])